@@ -1,28 +1,43 @@
 """ADC ADS1118 demo."""
 
+import struct
 import sys
 import time
 
 sys.path.insert(0, '../src/')
-from spi_adapter import SpiAdapter
+from spi_adapter import SpiAdapter, AuxPinMode
+
+# Unpacks the big endian signed 16 bit ADC value.
+_ADC_WORD = struct.Struct(">h")
 
 port = "COM18"
 
+# Aux pin that is wired to the ADC's DOUT/DRDY output. The ADS1118 pulls it
+# low when a conversion result is ready.
+drdy_aux_pin = 2
+
 print(f"Connecting to port {port}...", flush=True)
 spi =  SpiAdapter(port = port)
 print(f"Connected.", flush=True)
 
+spi.set_aux_pin_mode(drdy_aux_pin, AuxPinMode.INPUT_PULLUP)
+
 # Single shot, 2.046v FS, A0 input.
 config_byte_msb = 0b11000101
 config_byte_lsb = 0b10001010
 cmd = bytes([config_byte_msb, config_byte_lsb, 0x00, 0x00])
 
+# Frame the transaction once, outside of the polling loop.
+prepared_cmd = spi.prepare(cmd, mode=1)
+
 while True:
-  resp = spi.send(cmd, mode=1)
-  assert isinstance(resp, bytearray), type(resp)
+  resp = spi.send_prepared(prepared_cmd)
+  assert isinstance(resp, bytes), type(resp)
   assert len(resp) == 4
-  value = int.from_bytes(resp[0:2], byteorder='big', signed=True)
+  value = _ADC_WORD.unpack_from(resp, 0)[0]
   print(f"Response: {resp.hex(' ')} : {value:6d}", flush=True)
 
-  time.sleep(0.5)
+  # Wait for the next conversion result instead of sleeping for the worst
+  # case conversion time.
+  spi.wait_aux_pin(drdy_aux_pin, 0, timeout_ms=200)
 
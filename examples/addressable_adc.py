@@ -1,11 +1,15 @@
 """ADC ADS1118 demo."""
 
+import struct
 import sys
 import time
 
 sys.path.insert(0, '../src/')
 from spi_adapter import SpiAdapter
 
+# Unpacks the big endian signed 16 bit ADC value.
+_ADC_WORD = struct.Struct(">h")
+
 port = "COM18"
 
 print(f"Connecting to port {port}...", flush=True)
@@ -18,11 +22,16 @@ config_byte_lsb = 0b10001010
 spi_address = 15
 cmd = bytes([spi_address,config_byte_msb, config_byte_lsb, 0x00, 0x00])
 
+# Set the device config and frame the transaction once, outside of the
+# polling loop. The loop itself is then just a serial write and read.
+spi.configure(mode=1, speed=4000000)
+prepared_cmd = spi.prepare(cmd)
+
 while True:
-  resp = spi.send(cmd, mode=1, speed=4000000)
-  assert isinstance(resp, bytearray), type(resp)
+  resp = spi.send_prepared(prepared_cmd)
+  assert isinstance(resp, bytes), type(resp)
   assert len(resp) == 5
-  value = int.from_bytes(resp[1:3], byteorder='big', signed=True)
+  value = _ADC_WORD.unpack_from(resp, 1)[0]
   print(f"Response: {resp.hex(' ')} : {value:6d}", flush=True)
 
   time.sleep(0.5)
@@ -12,8 +12,7 @@ import datetime
 
 from spi_adapter import SpiAdapter, AuxPinMode
 from luma.oled.device import ssd1306
-from luma.core.render import canvas
-from PIL import ImageFont, ImageColor
+from PIL import Image, ImageDraw, ImageFont, ImageColor
 
 
 # Related readings
@@ -43,26 +42,27 @@ class MyLumaSerial:
         self.__spi = SpiAdapter(port)
         self.__spi.set_aux_pin_mode(dc_aux_pin, AuxPinMode.OUTPUT)
         self.__spi.set_aux_pin_mode(nrst_aux_pin, AuxPinMode.OUTPUT)
-        self.__spi.write_aux_pin(nrst_aux_pin, 0)
-        self.__spi.write_aux_pin(nrst_aux_pin, 1)
+        self.__spi.pulse_aux_pin(nrst_aux_pin, 0)
 
     def command(self, *cmd):
         """Send to the SPI display a command with given bytes."""
         self.__spi.write_aux_pins(0 << dc_aux_pin, 1 << dc_aux_pin)
-        payload =  bytes(list(cmd))
+        payload =  bytes(cmd)
         assert self.__spi.send(payload, read=False, speed=4000000) is not None
 
     def data(self, data):
         """Send to the SPI display data with given bytes."""
         self.__spi.write_aux_pins(1 << dc_aux_pin, 1 << dc_aux_pin)
-        i = 0
-        n = len(data)
-        while i < n:
-            # SPI Adapter limits to 256 bytes payload.
-            chunk_size = min(256, n - i)
-            payload =  bytes(data[i : i + chunk_size])
-            assert self.__spi.send(payload, read=False, speed=4000000) is not None
-            i += chunk_size
+        # Slice the data into chunks with zero-copy memoryviews. The SPI
+        # Adapter limits each transaction to a 256 bytes payload.
+        mv = memoryview(bytes(data))
+        requests = [
+            {"data": mv[i : i + 256], "read": False, "speed": 4000000}
+            for i in range(0, len(mv), 256)
+        ]
+        # Send all the chunks in a single serial round trip.
+        results = self.__spi.send_batch(requests)
+        assert all(result is not None for result in results)
 
 
 luma_serial = MyLumaSerial(my_port)
@@ -75,16 +75,20 @@ font2 = ImageFont.truetype("./fonts/OLED.otf", 12)
 white = ImageColor.getcolor("white", "1")
 black = ImageColor.getcolor("black", "1")
 
+# The image is persistent and the static frame and title are drawn just once.
+# Each iteration redraws only the region of the time text.
+image = Image.new("1", (luma_device.width, luma_device.height), black)
+draw = ImageDraw.Draw(image)
+draw.rectangle(luma_device.bounding_box, outline=white, fill=black)
+draw.text((20, 14), f"SPI Adapter", fill=white, font=font1)
+
 while True:
     time_str = "{0:%H:%M:%S}".format(datetime.datetime.now())
     print(f"Drawing {time_str}", flush=True)
-    # The canvas is drawn from scratch and is sent in its entirety to the display
-    # upon exiting the 'with' clause.
-    with canvas(luma_device) as draw:
-        draw.rectangle(luma_device.bounding_box, outline=white, fill=black)
-        draw.text((20, 14), f"SPI Adapter", fill=white, font=font1)
-        draw.text((33, 40), f"{time_str}", fill=white, font=font2)
-        # Uncomment to save screenshot.
-        # draw._image.save("oled_demo_screenshot.png")
+    draw.rectangle((33, 40, 94, 52), fill=black)
+    draw.text((33, 40), f"{time_str}", fill=white, font=font2)
+    # Uncomment to save screenshot.
+    # image.save("oled_demo_screenshot.png")
+    luma_device.display(image)
     time.sleep(1.0)
-    
+
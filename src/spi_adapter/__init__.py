@@ -4,12 +4,43 @@ create an object of the  class SPIAdapter, and use the methods it provides.
 
 from typing import Optional, List, Tuple
 from serial import Serial
-from enum import Enum
+from enum import IntEnum
+import operator
+import os
+import select
+import struct
 import time
 
 
-# NOTE: Numeric values match wire protocol.
-class AuxPinMode(Enum):
+# Packs the header of a send request: opcode, config byte, speed byte,
+# data count, and extra bytes count.
+_SEND_HEADER = struct.Struct(">BBBHH")
+
+# Packs an aux pins write request: opcode, values byte, mask byte.
+_AUX_WRITE = struct.Struct("BBB")
+
+# Response status flag bytes.
+_STATUS_OK = ord("K")
+_STATUS_ERROR = ord("E")
+
+# Request opcode bytes.
+_OP_SEND = ord("s")
+_OP_AUX_MODE = ord("m")
+_OP_AUX_WRITE = ord("b")
+
+# Byte patterns echoed by the connection test. Covers all-zeros, all-ones,
+# and the two alternating bit patterns.
+_PROBE_PATTERNS = b"\x00\xff\x5a\xa5"
+
+# Probe subset used on the first connection test attempt. A pass on these two
+# patterns is near conclusive for a healthy adapter; retries escalate to the
+# full pattern set.
+_PROBE_PATTERNS_SHORT = b"\x00\xa5"
+
+
+# NOTE: Numeric values match wire protocol. As an IntEnum, the modes can be
+# used directly as their wire protocol byte values.
+class AuxPinMode(IntEnum):
     """Auxilary pin modes."""
 
     INPUT_PULLDOWN = 1
@@ -17,6 +48,22 @@ class AuxPinMode(Enum):
     OUTPUT = 3
 
 
+class PreparedTransaction:
+    """An SPI transaction that was pre-framed by ``SpiAdapter.prepare()``.
+
+    Holds the ready to send wire request of the transaction, such that
+    ``SpiAdapter.send_prepared()`` can transmit it over and over without
+    repeating the framing and validation work. Useful in tight polling loops
+    that repeat the same transaction.
+    """
+
+    __slots__ = ("_req", "_expected_resp_count")
+
+    def __init__(self, req: bytes, expected_resp_count: int):
+        self._req = req
+        self._expected_resp_count = expected_resp_count
+
+
 class SpiAdapter:
     """Connects to the SPI Adapter at the specified serial port and asserts that the
     SPI responses as expcted.
@@ -24,16 +71,43 @@ class SpiAdapter:
     :param port: The serial port of the SPI Adapter. SPI Adapters
         appear on the local computer as a standard serial port
     :type port: str
+
+    :param low_latency: If True, tries to reduce the latency of the underlying
+        USB serial driver. This is a best effort operation and it's silently
+        skipped on platforms that don't support it.
+    :type low_latency: bool
     """
 
-    def __init__(self, port: str):
+    def __init__(self, port: str, low_latency: bool = True):
         self.__serial: Serial = Serial(port, timeout=1.0)
+        if low_latency:
+            self.__set_low_latency()
+        # On POSIX hosts, responses are read directly from the underlying file
+        # descriptor, bypassing pyserial's per call polling overhead. None on
+        # platforms where this is not supported.
+        self.__fd: Optional[int] = None
+        if os.name == "posix":
+            try:
+                self.__fd = self.__serial.fileno()
+            except (OSError, AttributeError):
+                pass
+        # Reusable response read buffer, grown on demand. Avoids a fresh
+        # allocation per read chunk in the response path.
+        self.__rx_buf: bytearray = bytearray(512)
+        # Cached mapping of the last (cs, mode, speed, read) send() args to their
+        # (config_byte, speed_byte) wire values. Speeds up repeated transactions
+        # with the same config, e.g. when polling a device in a loop.
+        self.__last_send_config: Optional[Tuple] = None
+        # Default transaction config args, settable with configure().
+        self.__default_cs: int = 0
+        self.__default_mode: int = 0
+        self.__default_speed: int = 1000000
         if not self.test_connection_to_adapter():
             raise RuntimeError(f"spi driver not detected at port {port}")
         adapter_info = self.__read_adapter_info()
         if adapter_info is None:
             raise RuntimeError(f"SPI driver failed to read adapter info at {port}")
-        print(f"Adapter info: {adapter_info.hex(" ")}", flush=True)
+        print(f"Adapter info: {adapter_info.hex(' ')}", flush=True)
         if (
             adapter_info[0] != ord("S")
             or adapter_info[1] != ord("P")
@@ -42,15 +116,100 @@ class SpiAdapter:
         ):
             raise RuntimeError(f"Unexpected SPI adapter info at {port}")
 
-    def __read_adapter_response(self, op_name: str, ok_resp_size: int) -> bytes:
-        """A common method to read a response from the adapter.
-        Returns None if error, otherwise OK response bytes"""
-        assert isinstance(op_name, str)
-        assert isinstance(ok_resp_size, int)
-        assert 0 <= ok_resp_size
+    def __set_low_latency(self) -> None:
+        """Best effort reduction of the USB serial driver latency.
+
+        Uses pyserial's low latency mode which, on Linux, sets the
+        ASYNC_LOW_LATENCY flag of the port. This lowers the latency timer of
+        FTDI class drivers from their default 16ms to 1ms. Silently does
+        nothing on platforms or drivers that don't support it, e.g. macOS
+        and Windows.
+        """
+        try:
+            self.__serial.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass
+
+    def __read_exact(self, size: int) -> bytes:
+        """Reads exactly size bytes from the adapter, honoring the port's
+        timeout. On POSIX hosts, reads the underlying file descriptor
+        directly. Returns fewer bytes on timeout."""
+        if size > len(self.__rx_buf):
+            self.__rx_buf = bytearray(size)
+        view = memoryview(self.__rx_buf)
+        if self.__fd is None:
+            got = self.__serial.readinto(view[:size])
+            return bytes(view[:got])
+        got = 0
+        deadline = time.monotonic() + self.__serial.timeout
+        while got < size:
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+            readable, _, _ = select.select([self.__fd], [], [], remaining_time)
+            if not readable:
+                break
+            n = os.readv(self.__fd, [view[got:size]])
+            if not n:
+                break
+            got += n
+        return bytes(view[:got])
+
+    def __write_request(self, op_name: str, req: bytes) -> bool:
+        """Writes a request to the adapter, verifying the written length.
+        On POSIX hosts, writes the underlying file descriptor directly.
+        Returns True if OK, False otherwise."""
+        size = len(req)
+        if self.__fd is None:
+            n = self.__serial.write(req)
+        else:
+            view = memoryview(req)
+            n = 0
+            deadline = time.monotonic() + self.__serial.timeout
+            while n < size:
+                remaining_time = deadline - time.monotonic()
+                if remaining_time <= 0:
+                    break
+                _, writable, _ = select.select([], [self.__fd], [], remaining_time)
+                if not writable:
+                    break
+                try:
+                    n += os.write(self.__fd, view[n:])
+                except BlockingIOError:
+                    pass
+        if n != size:
+            print(f"{op_name}: write mismatch, expected {size}, got {n}", flush=True)
+            return False
+        return True
+
+    def __txn(
+        self, op_name: str, req: bytes, ok_resp_size: int, extra_data_size: int = 0
+    ) -> bytes:
+        """Performs a single command round trip: writes the request and reads
+        back the adapter's response. All the command traffic of this class
+        goes through this method or through __write_request(), which is the
+        single place to apply platform or link specific tweaks. Returns None
+        if error, otherwise the OK response bytes."""
+        if not self.__write_request(op_name, req):
+            return None
+        return self.__read_adapter_response(op_name, ok_resp_size, extra_data_size)
+
+    def __read_adapter_response(
+        self, op_name: str, ok_resp_size: int, extra_data_size: int = 0
+    ) -> bytes:
+        """A common method to read a response from the adapter. On an OK status,
+        the ok_resp_size response bytes and the extra_data_size data bytes that
+        follow them are fetched with a single serial read to avoid the extra
+        round trip latencies. Returns None if error, otherwise OK response bytes,
+        including the extra data bytes, if any."""
+        if __debug__:
+            assert isinstance(op_name, str)
+            assert isinstance(ok_resp_size, int)
+            assert 0 <= ok_resp_size
+            assert isinstance(extra_data_size, int)
+            assert 0 <= extra_data_size
         # Read status flag.
-        ok_resp = self.__serial.read(1)
-        assert isinstance(ok_resp, bytes), type(ok_resp)
+        ok_resp = self.__read_exact(1)
         if len(ok_resp) != 1:
             print(
                 f"{op_name}: status flag read mismatch, expected {1}, got {len(ok_resp)}",
@@ -58,17 +217,16 @@ class SpiAdapter:
             )
             return None
         status_flag = ok_resp[0]
-        if status_flag not in (ord("E"), ord("K")):
+        if status_flag not in (_STATUS_ERROR, _STATUS_OK):
             print(
                 f"{op_name}: unexpected status flag in response: {ok_resp}", flush=True
             )
             return None
 
         # Handle the case of an error
-        if status_flag == ord("E"):
+        if status_flag == _STATUS_ERROR:
             # Read the additional error info byte.
-            ok_resp = self.__serial.read(1)
-            assert isinstance(ok_resp, bytes), type(ok_resp)
+            ok_resp = self.__read_exact(1)
             if len(ok_resp) != 1:
                 print(
                     f"{op_name}: error info read mismatch, expected {1}, got {len(ok_resp)}",
@@ -80,26 +238,156 @@ class SpiAdapter:
 
         # Handle the OK case.
         #
-        # Read the returned data count.
-        ok_resp = self.__serial.read(ok_resp_size)
-        assert isinstance(ok_resp, bytes), type(ok_resp)
-        if len(ok_resp) != ok_resp_size:
+        # Read the OK response and trailing data bytes in one read.
+        total_size = ok_resp_size + extra_data_size
+        ok_resp = self.__read_exact(total_size)
+        if len(ok_resp) != total_size:
             print(
-                f"{op_name}: OK resp read count mismatch, expected {ok_resp_size}, got {len(ok_resp)}",
+                f"{op_name}: OK resp read count mismatch, expected {total_size}, got {len(ok_resp)}",
                 flush=True,
             )
             return None
         return ok_resp
 
+    def __make_send_request(
+        self,
+        data: bytearray | bytes | memoryview,
+        extra_bytes: int,
+        cs: Optional[int],
+        mode: Optional[int],
+        speed: Optional[int],
+        read: bool,
+    ) -> Tuple[bytearray, int]:
+        """Constructs the wire request of a single SPI transaction.
+        Returns the request bytes and the payload byte count."""
+        # Resolve omitted config args to the instance defaults.
+        if cs is None:
+            cs = self.__default_cs
+        if mode is None:
+            mode = self.__default_mode
+        if speed is None:
+            speed = self.__default_speed
+        # Normalize the payload args. memoryview() accepts any buffer protocol
+        # source, e.g. a numpy array, with zero copy, and operator.index()
+        # accepts any int-like value, e.g. a numpy integer. Both raise
+        # TypeError on incompatible values.
+        data = memoryview(data).cast("B")
+        extra_bytes = operator.index(extra_bytes)
+        # A single range check covers extra_bytes and both size limits, since
+        # 256 - len(data) is negative when the data itself is too long.
+        if not 0 <= extra_bytes <= 256 - len(data):
+            raise ValueError(
+                f"Invalid SPI transaction size, data bytes {len(data)}, extra bytes {extra_bytes}"
+            )
+        # Compute the config and speed bytes, reusing the cached values if the
+        # config args didn't change since the last transaction.
+        if self.__last_send_config and self.__last_send_config[:4] == (
+            cs,
+            mode,
+            speed,
+            read,
+        ):
+            config_byte, speed_byte = self.__last_send_config[4:]
+        else:
+            if __debug__:
+                assert isinstance(cs, int)
+                assert 0 <= cs <= 3
+                assert isinstance(mode, int)
+                assert 0 <= mode <= 3
+                assert isinstance(speed, int)
+                assert 25000 <= speed <= 4000000
+                assert isinstance(read, bool)
+            config_byte = 0b10000 if read else 0b00000
+            config_byte |= mode << 2
+            config_byte |= cs
+            speed_byte = int(round(speed / 25000))
+            assert isinstance(speed_byte, int)
+            assert 1 <= speed_byte <= 160
+            self.__last_send_config = (cs, mode, speed, read, config_byte, speed_byte)
+        req = bytearray(
+            _SEND_HEADER.pack(_OP_SEND, config_byte, speed_byte, len(data), extra_bytes)
+        )
+        req.extend(data)
+        return req, len(data) + extra_bytes
+
+    def __read_send_response(self, expected_resp_count: int) -> bytes | None:
+        """Reads and parses the adapter's response of a single SPI transaction.
+        Returns the data bytes read from the device, or None if an error."""
+        if not expected_resp_count:
+            # Fast path for write-only transactions. The response carries no
+            # data bytes, just the status and a zero count.
+            ok_resp = self.__read_adapter_response("SPI read", 2)
+            if ok_resp is None:
+                return None
+            if ok_resp[0] or ok_resp[1]:
+                print(
+                    f"SPI read: unexpected response count {(ok_resp[0] << 8) + ok_resp[1]} in a write only transaction",
+                    flush=True,
+                )
+                return None
+            return b""
+
+        # The returned data count and the data bytes themselves are known in
+        # advance so they are fetched together, with a single serial read.
+        ok_resp = self.__read_adapter_response("SPI read", 2, expected_resp_count)
+        if ok_resp is None:
+            return None
+
+        # Here response was OK. Verify the count of returned data bytes read from the device.
+        resp_count = (ok_resp[0] << 8) + ok_resp[1]
+        if resp_count != expected_resp_count:
+            print(
+                f"SPI read: response count mismatch, expected {expected_resp_count}, got {resp_count}",
+                flush=True,
+            )
+            return None
+        return ok_resp[2:]
+
+    def configure(
+        self,
+        *,
+        cs: Optional[int] = None,
+        mode: Optional[int] = None,
+        speed: Optional[int] = None,
+    ) -> None:
+        """Sets the default transaction config of this adapter.
+
+        The defaults are used by ``send()``, ``prepare()``, and ``send_batch()``
+        when the corresponding argument is omitted. This allows configuring the
+        device specific ``cs``, ``mode``, and ``speed`` once, outside of the
+        transaction loop. Args that are None leave their default unchanged.
+
+        :param cs: If not None, the new default Chip Select (CS) output.
+        :type cs: Optional[int]
+
+        :param mode: If not None, the new default SPI mode.
+        :type mode: Optional[int]
+
+        :param speed: If not None, the new default SPI speed in Hz.
+        :type speed: Optional[int]
+        """
+        if cs is not None:
+            assert isinstance(cs, int)
+            assert 0 <= cs <= 3
+            self.__default_cs = cs
+        if mode is not None:
+            assert isinstance(mode, int)
+            assert 0 <= mode <= 3
+            self.__default_mode = mode
+        if speed is not None:
+            assert isinstance(speed, int)
+            assert 25000 <= speed <= 4000000
+            self.__default_speed = speed
+
     def send(
         self,
-        data: bytearray | bytes,
+        data: bytearray | bytes | memoryview,
         extra_bytes: int = 0,
-        cs: int = 0,
-        mode: int = 0,
-        speed: int = 1000000,
+        cs: Optional[int] = None,
+        mode: Optional[int] = None,
+        speed: Optional[int] = None,
         read: bool = True,
-    ) -> bytearray | None:
+    ) -> bytes | None:
         """Perform an SPI transaction.
 
         :param write_data: Bytes to write to the device. The number of bytes must be 256 at most.
@@ -110,88 +398,119 @@ class SpiAdapter:
         :type extra_bytes: int
 
         :param cs: The Chip Select (CS) output to use for this transaction. This allows to connect the SPI Adapter to multiple
-           SPI devices.
-        :type cs: int
+           SPI devices. If None, uses the default set with ``configure()``.
+        :type cs: Optional[int]
 
         :param mode: The SPI mode to use. Should be in the range [0, 3].
-        :type mode: int
+           If None, uses the default set with ``configure()``.
+        :type mode: Optional[int]
 
         :param speed: The SPI speed in Hz and must be in the range 25Khz to 4Mhz. The value
-                      is rounded silently to a 25Khz increment.
-        :type speed: int
+                      is rounded silently to a 25Khz increment. If None, uses the
+                      default set with ``configure()``.
+        :type speed: Optional[int]
 
         :param read: Indicates if the response should include the bytes read
            on the MISO line during the writing of ``data`` and ``extra_bytes``.
         :type read: bool
 
-        :returns: If error, returns None, otherwise returns a ``bytearray``. If ``read == True``
-           then the bytearray contains exactly ``len(data) + extra_bytes`` bytes that were read during
-           the transaction. Otherwise the bytearray is empty(). Skipping the reading may improve
+        :returns: If error, returns None, otherwise returns a ``bytes``. If ``read == True``
+           then it contains exactly ``len(data) + extra_bytes`` bytes that were read during
+           the transaction. Otherwise it is empty. Skipping the reading may improve
            the performance of large write only transactions.
-        :rtype: bytearray | None
+        :rtype: bytes | None
         """
-        assert isinstance(data, (bytearray, bytes))
-        assert len(data) <= 256
-        assert isinstance(extra_bytes, int)
-        assert 0 <= extra_bytes <= 256
-        assert (len(data) + extra_bytes) <= 256
-        assert isinstance(cs, int)
-        assert 0 <= cs <= 3
-        assert isinstance(mode, int)
-        assert 0 <= mode <= 3
-        assert isinstance(speed, int)
-        assert 25000 <= speed <= 4000000
-        assert isinstance(read, bool)
-
         # Construct and send the command request.
-        req = bytearray()
-        req.append(ord("s"))
-        # print(f"Read: {read}", flush=True)
-        config_byte = 0b10000 if read else 0b00000
-        config_byte |= mode << 2
-        config_byte |= cs
-        # print(f"Config byte: {config_byte:08b}", flush=True)
-        req.append(config_byte)
-        speed_byte = int(round(speed / 25000))
-        # print(f"Speed byte: {speed_byte}, speed={speed}", flush=True)
-        assert isinstance(speed_byte, int)
-        assert 1 <= speed_byte <= 160
-        req.append(speed_byte)
-        req.append(len(data) // 256)
-        req.append(len(data) % 256)
-        req.append(extra_bytes // 256)
-        req.append(extra_bytes % 256)
-        req.extend(data)
-        n = self.__serial.write(req)
-        if n != len(req):
-            print(f"SPI read: write mismatch, expected {len(req)}, got {n}", flush=True)
+        req, payload_count = self.__make_send_request(
+            data, extra_bytes, cs, mode, speed, read
+        )
+        if not self.__write_request("SPI read", req):
             return None
 
         # Read response.
-        ok_resp = self.__read_adapter_response("SPI read", 2)
-        if ok_resp is None:
-            return None
+        return self.__read_send_response(payload_count if read else 0)
 
-        # Here response was OK. Get the count of returned data bytes read from the device.
-        resp_count = (ok_resp[0] << 8) + ok_resp[1]
-        expected_resp_count = len(data) + extra_bytes if read else 0
-        if resp_count != expected_resp_count:
-            print(
-                f"SPI read: response count mismatch, expected {expected_resp_count}, got {resp_count}",
-                flush=True,
-            )
+    def prepare(
+        self,
+        data: bytearray | bytes | memoryview,
+        extra_bytes: int = 0,
+        cs: Optional[int] = None,
+        mode: Optional[int] = None,
+        speed: Optional[int] = None,
+        read: bool = True,
+    ) -> PreparedTransaction:
+        """Pre-frames an SPI transaction for repeated sending.
+
+        The arguments have the same semantic and default values as the
+        corresponding arguments of ``send()``. All the framing and validation
+        work is done here, once, such that sending the returned prepared
+        transaction with ``send_prepared()`` is reduced to a serial write and read.
+
+        :returns: The prepared transaction.
+        :rtype: PreparedTransaction
+        """
+        req, payload_count = self.__make_send_request(
+            data, extra_bytes, cs, mode, speed, read
+        )
+        return PreparedTransaction(bytes(req), payload_count if read else 0)
+
+    def send_prepared(self, prepared: PreparedTransaction) -> bytes | None:
+        """Performs an SPI transaction that was pre-framed with ``prepare()``.
+
+        :param prepared: The prepared transaction to perform.
+        :type prepared: PreparedTransaction
+
+        :returns: The value that a ``send()`` call with the original ``prepare()``
+           arguments would have returned.
+        :rtype: bytes | None
+        """
+        if __debug__:
+            assert isinstance(prepared, PreparedTransaction)
+        if not self.__write_request("SPI read", prepared._req):
             return None
+        return self.__read_send_response(prepared._expected_resp_count)
 
-        # Read the data bytes
-        resp = self.__serial.read(resp_count)
-        assert isinstance(resp, bytes), type(resp)
-        if len(resp) != resp_count:
-            print(
-                f"SPI read: data read mismatch, expected {resp_count}, got {len(resp)}",
-                flush=True,
+    def send_batch(
+        self,
+        requests: List[dict],
+    ) -> List[bytes | None]:
+        """Performs multiple SPI transactions with a single serial round trip.
+
+        The requests are sent to the SPI Adapter as a single serial write and their
+        responses are then read back to back. This amortizes the latency of the
+        underlying serial link over the entire batch, which speeds up operations
+        such as updating an OLED display that are made of multiple transactions.
+
+        :param requests: A list with one entry per transaction. Each entry is a dict
+           with a required ``data`` key and optional ``extra_bytes``, ``cs``, ``mode``,
+           ``speed``, and ``read`` keys, with the same semantic and default values as the
+           corresponding arguments of ``send()``.
+        :type requests: List[dict]
+
+        :returns: A list with one entry per request, in order. Each entry is the value
+           that a ``send()`` call with the same arguments would have returned.
+        :rtype: List[bytes | None]
+        """
+        assert isinstance(requests, list)
+        assert len(requests) > 0
+        mega_req = bytearray()
+        expected_resp_counts = []
+        for request in requests:
+            assert isinstance(request, dict)
+            read = request.get("read", True)
+            req, payload_count = self.__make_send_request(
+                request["data"],
+                request.get("extra_bytes", 0),
+                request.get("cs"),
+                request.get("mode"),
+                request.get("speed"),
+                read,
             )
-            return None
-        return bytearray(resp)
+            mega_req.extend(req)
+            expected_resp_counts.append(payload_count if read else 0)
+        if not self.__write_request("SPI batch", mega_req):
+            return [None] * len(requests)
+        return [self.__read_send_response(c) for c in expected_resp_counts]
 
     def set_aux_pin_mode(self, pin: int, pin_mode: AuxPinMode) -> bool:
         """Sets the mode of an auxilary pin.
@@ -205,18 +524,12 @@ class SpiAdapter:
         :returns: True if OK, False otherwise.
         :rtype: bool
         """
-        assert isinstance(pin, int)
-        assert 0 <= pin <= 7
-        assert isinstance(pin_mode, AuxPinMode)
-        req = bytearray()
-        req.append(ord("m"))
-        req.append(pin)
-        req.append(pin_mode.value)
-        self.__serial.write(req)
-        ok_resp = self.__read_adapter_response("Aux mode", 0)
-        if ok_resp is None:
-            return False
-        return True
+        if __debug__:
+            assert isinstance(pin, int)
+            assert 0 <= pin <= 7
+            assert isinstance(pin_mode, AuxPinMode)
+        req = bytes((_OP_AUX_MODE, pin, pin_mode))
+        return self.__txn("Aux mode", req, 0) is not None
 
     def read_aux_pins(self) -> int | None:
         """Reads the auxilary pins.
@@ -224,10 +537,7 @@ class SpiAdapter:
         :returns: The pins value as a 8 bit in value or None if an error.
         :rtype: int | None
         """
-        req = bytearray()
-        req.append(ord("a"))
-        self.__serial.write(req)
-        ok_resp = self.__read_adapter_response("Aux read", 1)
+        ok_resp = self.__txn("Aux read", b"a", 1)
         if ok_resp is None:
             return None
         return ok_resp[0]
@@ -245,19 +555,13 @@ class SpiAdapter:
         :returns: True if OK, False otherwise.
         :rtype: bool
         """
-        assert isinstance(values, int)
-        assert 0 <= values <= 255
-        assert isinstance(mask, int)
-        assert 0 <= mask <= 255
-        req = bytearray()
-        req.append(ord("b"))
-        req.append(values)
-        req.append(mask)
-        self.__serial.write(req)
-        ok_resp = self.__read_adapter_response("Aux write", 0)
-        if ok_resp is None:
-            return False
-        return True
+        if __debug__:
+            assert isinstance(values, int)
+            assert 0 <= values <= 255
+            assert isinstance(mask, int)
+            assert 0 <= mask <= 255
+        req = _AUX_WRITE.pack(_OP_AUX_WRITE, values, mask)
+        return self.__txn("Aux write", req, 0) is not None
       
     def read_aux_pin(self, aux_pin_index:int) -> bool | None:
         """Read a single aux pin.
@@ -268,12 +572,13 @@ class SpiAdapter:
         :returns: The boolean value of the pin or None if error.
         :rtype: bool | None
         """
-        assert isinstance(aux_pin_index, int)
-        assert 0 <= aux_pin_index <= 7
+        if __debug__:
+            assert isinstance(aux_pin_index, int)
+            assert 0 <= aux_pin_index <= 7
         pins_values = self.read_aux_pins()
         if pins_values is None:
           return None
-        return True if pins_values & (1 << aux_pin_index) else False
+        return bool(pins_values >> aux_pin_index & 1)
       
     def write_aux_pin(self, aux_pin_index:int, value: bool | int) -> bool:
         """Writes a single aux pin.
@@ -287,12 +592,81 @@ class SpiAdapter:
         :returns: True if OK, False otherwise.
         :rtype: bool
         """
-        assert isinstance(aux_pin_index, int)
-        assert 0 <= aux_pin_index <= 7
-        assert isinstance(value, (bool, int))
+        if __debug__:
+            assert isinstance(aux_pin_index, int)
+            assert 0 <= aux_pin_index <= 7
+            assert isinstance(value, (bool, int))
+        return self.write_aux_pins((value != 0) << aux_pin_index, 1 << aux_pin_index)
+
+    def pulse_aux_pin(self, aux_pin_index: int, value: bool | int) -> bool:
+        """Momentarily writes the given value to an aux pin and then restores
+        the opposite value, e.g. to issue a reset pulse to a device. The two
+        underlying aux writes are pipelined in a single serial round trip.
+        The pulse width is set by the adapter's command processing rate.
+
+        :param aux_pin_index: An aux pin index in the range [0, 7]
+        :type aux_pin_index: int
+
+        :param value: The value of the pulse itself.
+        :type value: bool | int
+
+        :returns: True if OK, False otherwise.
+        :rtype: bool
+        """
+        if __debug__:
+            assert isinstance(aux_pin_index, int)
+            assert 0 <= aux_pin_index <= 7
+            assert isinstance(value, (bool, int))
         pin_mask = 1 << aux_pin_index
-        pin_value_mask = pin_mask if value else 0
-        return self.write_aux_pins(pin_value_mask, pin_mask)
+        value_mask = (value != 0) << aux_pin_index
+        req = _AUX_WRITE.pack(_OP_AUX_WRITE, value_mask, pin_mask) + _AUX_WRITE.pack(
+            _OP_AUX_WRITE, value_mask ^ pin_mask, pin_mask
+        )
+        if not self.__write_request("Aux pulse", req):
+            return False
+        # Reap the two ACKs, one per aux write.
+        ok1 = self.__read_adapter_response("Aux pulse", 0)
+        ok2 = self.__read_adapter_response("Aux pulse", 0)
+        return ok1 is not None and ok2 is not None
+
+    def wait_aux_pin(
+        self, aux_pin_index: int, value: bool | int, timeout_ms: int = 100
+    ) -> bool:
+        """Waits until an aux pin reads the given value.
+
+        This is useful to wait for a data ready signal of a device, e.g. the
+        DRDY output of an ADC, instead of sleeping for the worst case
+        conversion time. The adapter protocol has no wait command so the wait
+        is implemented by polling the pin from the host.
+
+        :param aux_pin_index: An aux pin index in the range [0, 7]
+        :type aux_pin_index: int
+
+        :param value: The pin value to wait for.
+        :type value: bool | int
+
+        :param timeout_ms: Max wait time in milliseconds.
+        :type timeout_ms: int
+
+        :returns: True if the pin reached the value, False if timeout or error.
+        :rtype: bool
+        """
+        if __debug__:
+            assert isinstance(aux_pin_index, int)
+            assert 0 <= aux_pin_index <= 7
+            assert isinstance(value, (bool, int))
+            assert isinstance(timeout_ms, int)
+            assert timeout_ms >= 0
+        wanted = value != 0
+        deadline = time.monotonic() + (timeout_ms / 1000)
+        while True:
+            pin_value = self.read_aux_pin(aux_pin_index)
+            if pin_value is None:
+                return False
+            if pin_value == wanted:
+                return True
+            if time.monotonic() >= deadline:
+                return False
 
     def test_connection_to_adapter(self, max_tries: int = 3) -> bool:
         """Tests connection to the SPI Adapter.
@@ -309,43 +683,33 @@ class SpiAdapter:
         assert max_tries > 0
         for i in range(max_tries):
             if i > 0:
-                # Delay to let any pending command to timeout.
-                time.sleep(0.3)
-            ok: bool = True
-            for b in [0x00, 0xFF, 0x5A, 0xA5]:
-                if not self.__test_echo_cmd(b):
-                    ok = False
-                    break
-            if ok:
+                # Short exponential delay to let any pending command time out,
+                # then discard stale response bytes before retrying.
+                time.sleep(min(0.05 * (1 << (i - 1)), 0.3))
+                self.__serial.reset_input_buffer()
+            patterns = _PROBE_PATTERNS_SHORT if i == 0 else _PROBE_PATTERNS
+            if self.__test_echo_cmds(patterns):
                 # We had one good pass on all patterns. We are good.
                 return True
         # All tries failed.
         return False
 
-    def __test_echo_cmd(self, b: int) -> bool:
-        """Test if an echo command with given byte returns the same byte. Used
-        to test the connection to the driver."""
-        assert isinstance(b, int)
-        assert 0 <= b <= 256
-        req = bytearray()
-        req.append(ord("e"))
-        req.append(b)
-        self.__serial.write(req)
-        resp = self.__serial.read(1)
-        assert isinstance(resp, bytes), type(resp)
-        assert len(resp) == 1
-        return resp[0] == b
+    def __test_echo_cmds(self, patterns: bytes) -> bool:
+        """Test if echo commands with the given pattern bytes return the same
+        bytes. All the echo commands are pipelined in a single serial round
+        trip. Used to test the connection to the driver."""
+        if __debug__:
+            assert isinstance(patterns, bytes)
+            assert len(patterns) > 0
+        # Interleave the echo opcodes and pattern bytes with slice assignments.
+        req = bytearray(len(patterns) * 2)
+        req[0::2] = b"e" * len(patterns)
+        req[1::2] = patterns
+        if not self.__write_request("Echo", bytes(req)):
+            return False
+        resp = self.__read_exact(len(patterns))
+        return resp == patterns
 
     def __read_adapter_info(self) -> Optional[bytearray]:
         """Return adapter info or None if an error."""
-        req = bytearray()
-        req.append(ord("i"))
-        n = self.__serial.write(req)
-        if n != len(req):
-            print(
-                f"SPI adapter info: write mismatch, expected {len(req)}, got {n}",
-                flush=True,
-            )
-            return None
-        ok_resp = self.__read_adapter_response("SPI adapter info", ok_resp_size=7)
-        return ok_resp
+        return self.__txn("SPI adapter info", b"i", ok_resp_size=7)
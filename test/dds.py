@@ -3,13 +3,46 @@
 # See example here
 # https://github.com/RobTillaart/AD9833/blob/master/AD9833.cpp
 
+import struct
 import time
 from spi_adapter import SpiAdapter
-from typing import List
+from typing import Tuple
 
 # port = "COM18"
 port = "/dev/tty.usbmodem1101"
 
+# Frequency register scaling: freq_reg = freq_hz * 2^28 / crystal_hz.
+_FREQ_NUM = 1 << 28
+_FREQ_DEN = 25_000_000
+
+# Precomputed DDS register bit masks and flags.
+_MASK14 = (1 << 14) - 1
+_BIT8 = 1 << 8
+_BIT13 = 1 << 13
+_BIT14 = 1 << 14
+
+
+
+def _ones(num_bits: int) -> int:
+    """Construct a bit mask with N LSB bits set."""
+    assert isinstance(num_bits, int)
+    assert 0 <= num_bits <= 16
+    result = int((1 << (num_bits)) - 1)
+    assert isinstance(result, int)
+    assert 0 <= result <= 0xffff, f"{num_bits = }, {result = }"
+    return result
+
+
+def _bits(*bit_indexes: int) -> int:
+    """Construct a bit mask with given bits set."""
+    result: int = 0
+    for bit_index in bit_indexes:
+        assert isinstance(bit_index, int), type(bit_index)
+        assert 0 <= bit_index <= 15
+        result = result | (1 << bit_index)
+    assert isinstance(result, int)
+    assert 0 <= result <= _ones(16)
+    return result
 
 
 class Dds:
@@ -17,56 +50,32 @@ class Dds:
         self.__port = port
         self.__spi = None
 
-    @classmethod
-    def ones(cls, num_bits: int) -> int:
-        """Construct a bit mask with N LSB bits set."""
-        assert isinstance(num_bits, int)
-        assert 0 <= num_bits <= 16
-        result = int((1 << (num_bits)) - 1)
-        assert isinstance(result, int)
-        assert 0 <= result <= 0xffff, f"{num_bits = }, {result = }"
-        return result
-
-    @classmethod
-    def bits(cls, *bit_indexes: int) -> int:
-        """Construct a bit mask with given bits set."""
-        result: int = 0
-        for bit_index in bit_indexes:
-            assert isinstance(bit_index, int), type(bit_index)
-            assert 0 <= bit_index <= 15
-            result = result | (1 << bit_index)
-        assert isinstance(result, int)
-        assert 0 <= result <= cls.ones(16)
-        return result
-
     def __send_cmd_words(self, *words: int) -> None:
         """Send to the DDS device N 16 bit words over SPI."""
         assert self.__spi is not None
         assert len(words) > 0
-        data_bytes = bytearray()
-        for w in words:
-            assert isinstance(w, int), type(w)
-            assert 0 <= w <= self.ones(16)
-            data_bytes.append(w >> 8)
-            data_bytes.append(w & self.ones(8))
+        if __debug__:
+            for w in words:
+                assert isinstance(w, int), type(w)
+                assert 0 <= w <= _ones(16)
+        # Pack all the big endian 16 bit words with a single C-level call.
+        data_bytes = struct.pack(f">{len(words)}H", *words)
         result = self.__spi.send(data_bytes, mode=2, read=False)
         assert result is not None
 
-    def __frequency_cmd_words(self, freq_hz: int) -> List[int]:
+    def __frequency_cmd_words(self, freq_hz: int) -> Tuple[int, ...]:
         """Return the command words to set the DDS frequency"""
         # Compute DDS freq register value
         assert isinstance(freq_hz, int)
         assert 0 <= freq_hz <= 20000
-        freq_reg_val = int((1 << 28) * freq_hz / 25_000_000)
-        assert 0 <= freq_reg_val < (1 << 28)
-        # Write to the config register and the frequency reg.
-        words = []
-        # Config reg.
-        words.append(self.bits(13))
-        # Freq0 LSB, MSB words.
-        words.append(self.bits(14) | freq_reg_val & self.ones(14))
-        words.append(self.bits(14) | freq_reg_val >> 14)
-        return words
+        freq_reg_val = (freq_hz * _FREQ_NUM) // _FREQ_DEN
+        assert 0 <= freq_reg_val < _FREQ_NUM
+        # Config reg word, then Freq0 LSB and MSB words.
+        return (
+            _BIT13,
+            _BIT14 | freq_reg_val & _MASK14,
+            _BIT14 | freq_reg_val >> 14,
+        )
 
     def connect(self) -> None:
         print(f"Connecting DDS SPI to port {self.__port}.", flush=True)
@@ -78,11 +87,8 @@ class Dds:
         """Reset the DDS. Output is disabled upon return and
         ADC is at mid point."""
         assert self.__spi is not None
-        # Set frequency to zero.
-        words = self.__frequency_cmd_words(0)
-        # Tobble config reset bit on and then off.
-        words.append(self.bits(8))
-        words.append(self.bits())
+        # Set frequency to zero, then toggle the config reset bit on and off.
+        words = self.__frequency_cmd_words(0) + (_BIT8, 0)
         self.__send_cmd_words(*words)
 
     def set_frequency(self, freq_hz: int) -> None:
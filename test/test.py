@@ -13,10 +13,14 @@ print(f"Connected.", flush=True)
 spi.set_aux_pin_mode(0, AuxPinMode.OUTPUT)
 
 
+# The constant payload sent on every iteration.
+PAYLOAD = bytes((1, 2, 3))
+
 i = 0
 while True:
   i += 1
-  print(f"\n{i:04d} Sending...", flush=True)
+  # No flush on the per-iteration prints, line buffering is good enough.
+  print(f"\n{i:04d} Sending...")
 
   #spi.write_aux_pins(i % 256, 0b00000001)
   #   cs = 0  #i % 4
@@ -24,9 +28,8 @@ while True:
   #   #speed = 4000000
   #   #result = spi.send(bytearray([0x11, 0x22, 0x33]), extra_bytes=2, cs=cs, mode=mode, speed=speed, read=True)
 
-  data = bytearray([1, 2, 3])
-  result = spi.send(data, read=True)
-  print(f"{i:04d} Result: {result.hex(' ')}", flush=True)
+  result = spi.send(PAYLOAD, read=True)
+  print(f"{i:04d} Result: {result.hex(' ')}")
   time.sleep(0.5)
   
 